@@ -1,18 +1,19 @@
 import asyncio
+import os
+from contextlib import AsyncExitStack, asynccontextmanager
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Tuple, overload
+from typing import TYPE_CHECKING, Any, AsyncGenerator, Callable, Dict, List, Set, Tuple, overload
 
 from textual import work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import ScrollableContainer
 from textual.widgets import Footer, Header, ProgressBar, SelectionList, Static, TabbedContent, TabPane
+from textual.worker import Worker
 
 from .config import Config
 from .log import Logger
 from .modals.confirm_inevitable import ConfirmInevitable
-from .modals.po_review_sc import POReviewScreen
-from .modals.po_translation_sc import Translator
 from .translation import get_display_name_for_lang_code
 from .types.subcommand import SubCommands
 from .utils import apply_styles, handle_exception, run_babel_cmd, wait_for_element
@@ -28,6 +29,7 @@ class UnbabelizerApp(App[None]):
 
     BINDINGS = [
         Binding(key="r", action="run_workflow", description=_("Run Workflow"), show=True),
+        Binding(key="a", action="run_workflow_all", description=_("Run Workflow for all languages"), show=True),
         Binding(key="q", action="quit", description=_("Quit"), show=True),
         Binding(key="c", action="clear", description=_("Clear translation files"), show=True),
     ]
@@ -43,9 +45,22 @@ class UnbabelizerApp(App[None]):
         self._app_logger = logger or Logger()
         self._config = config
         self._config.locale_dir.mkdir(parents=True, exist_ok=True)
-        self._lock = asyncio.Lock()
-        self._current_lang_idx = 0
+        # Flows of one language run in the order they were started, flows of different languages do not
+        # wait for each other. Babel steps sharing the .pot file or the whole locale tree hold the catalog lock.
+        self._lang_locks = {lang: asyncio.Lock() for lang in self._config.dest_lang}
+        self._catalog_lock = asyncio.Lock()
+        self._lang_indices = {lang: idx for idx, lang in enumerate(self._config.dest_lang)}
+        self.current_lang_idx = 0
         self._workflow_running = False
+        self._selection_lists: Dict[str, SelectionList[str]] = {}
+        self._progress_bars: Dict[str, ProgressBar] = {}
+        # Workflow actions in execution order, mapped to the flows implementing them
+        self._workflow_actions: Tuple[Tuple[str, Callable[[], Worker[None]]], ...] = (
+            (SubCommands.EXTRACT_UPDATE.command_name, self.flow_extract_and_update),
+            (SubCommands.TRANSLATE.command_name, self.flow_translate_pofile),
+            (SubCommands.REVIEW.command_name, self.flow_review_pofile),
+            (SubCommands.COMPILE.command_name, self.flow_compile_translations),
+        )
         self.logger.debug(
             "unbabelizerApp initialized with config:", extra={"config": self._config, "context": "unbabelizerApp.init"}
         )
@@ -60,42 +75,64 @@ class UnbabelizerApp(App[None]):
         """Path to the .pot file."""
         return self._config.potfile_path
 
+    @property
+    def current_lang_idx(self) -> int:
+        """Index of the target language in the configured destination languages."""
+        return self._current_lang_idx
+
+    @current_lang_idx.setter
+    def current_lang_idx(self, value: int):
+        """Set the target language and cache the values derived from it."""
+        self._current_lang_idx = value
+        self._current_lang = self._config.dest_lang[value]
+        self._current_pofile_path = self._config.get_pofile_path(value)
+
+    @property
+    def current_lang(self) -> str:
+        """Code of the target language."""
+        return self._current_lang
+
     @property
     def pofile_path(self) -> Path:
         """Path to the .po file for the target language."""
-        return self._config.get_pofile_path(self._current_lang_idx)
+        return self._current_pofile_path
 
     def compose(self) -> ComposeResult:
         """Compose the UI elements for the main application."""
         yield Header()
+        # The workflow title and options are the same for every language, translate and evaluate them once
+        workflow_title = _("Translation Workflow")
+        workflow_options = (
+            (
+                SubCommands.EXTRACT_UPDATE.command_description,
+                SubCommands.EXTRACT_UPDATE.command_name,
+                self._config.is_workflow_action_enabled(SubCommands.EXTRACT_UPDATE, True),
+            ),
+            (
+                SubCommands.TRANSLATE.command_description,
+                SubCommands.TRANSLATE.command_name,
+                self._config.is_workflow_action_enabled(SubCommands.TRANSLATE, False),
+            ),
+            (
+                SubCommands.REVIEW.command_description,
+                SubCommands.REVIEW.command_name,
+                self._config.is_workflow_action_enabled(SubCommands.REVIEW, True),
+            ),
+            (
+                SubCommands.COMPILE.command_description,
+                SubCommands.COMPILE.command_name,
+                self._config.is_workflow_action_enabled(SubCommands.COMPILE, True),
+            ),
+        )
         with TabbedContent(initial=""):
 
             for lang in self._config.dest_lang:
                 with TabPane(get_display_name_for_lang_code(lang), name=lang):
                     yield apply_styles(
                         ScrollableContainer(
-                            Static(_("Translation Workflow")),
+                            Static(workflow_title),
                             SelectionList(
-                                (
-                                    SubCommands.EXTRACT_UPDATE.command_description,
-                                    SubCommands.EXTRACT_UPDATE.command_name,
-                                    self._config.is_workflow_action_enabled(SubCommands.EXTRACT_UPDATE, True),
-                                ),
-                                (
-                                    SubCommands.TRANSLATE.command_description,
-                                    SubCommands.TRANSLATE.command_name,
-                                    self._config.is_workflow_action_enabled(SubCommands.TRANSLATE, False),
-                                ),
-                                (
-                                    SubCommands.REVIEW.command_description,
-                                    SubCommands.REVIEW.command_name,
-                                    self._config.is_workflow_action_enabled(SubCommands.REVIEW, True),
-                                ),
-                                (
-                                    SubCommands.COMPILE.command_description,
-                                    SubCommands.COMPILE.command_name,
-                                    self._config.is_workflow_action_enabled(SubCommands.COMPILE, True),
-                                ),
+                                *workflow_options,
                                 id=f"workflow_selection_list_{lang}",
                             ),
                             apply_styles(
@@ -113,31 +150,35 @@ class UnbabelizerApp(App[None]):
 
     async def on_mount(self):
         """Handle the mount event for the application."""
-        (
-            await wait_for_element(
-                self.query_one,
-                selector=f"#workflow_selection_list_{self._config.dest_lang[self._current_lang_idx]}",
-                expect_type=SelectionList,
+        # The per-language widgets never change after composing, resolve them once
+        for lang in self._config.dest_lang:
+            self._selection_lists[lang] = await wait_for_element(
+                self.query_one, selector=f"#workflow_selection_list_{lang}", expect_type=SelectionList
+            )
+            self._progress_bars[lang] = await wait_for_element(
+                self.query_one, selector=f"#progress_bar_{lang}", expect_type=ProgressBar
             )
-        ).focus()
+
+        self._selection_lists[self.current_lang].focus()
 
     async def on_tabbed_content_tab_activated(self, message: TabbedContent.TabActivated):
         """Handle tab activation events to switch target languages."""
-        if (
-            not message.tabbed_content.active_pane
-            or message.tabbed_content.active_pane.name not in self._config.dest_lang
-        ):
+        active_pane = message.tabbed_content.active_pane
+        if not active_pane or active_pane.name not in self._lang_indices:
             self.logger.warning(
                 "Activated tab not in configured destination languages",
                 extra={"activated_tab": message.tab.id, "context": "unbabelizerApp.on_tabbed_content_tab_activated"},
             )
             return
 
-        self._current_lang_idx = self._config.dest_lang.index(f"{message.tabbed_content.active_pane.name}")
+        if active_pane.name == self.current_lang:
+            return
+
+        self.current_lang_idx = self._lang_indices[active_pane.name]
         self.logger.info(
             "Target language changed",
             extra={
-                "new_language": self._config.dest_lang[self._current_lang_idx],
+                "new_language": self.current_lang,
                 "context": "unbabelizerApp.on_tabbed_content_tab_activated",
             },
         )
@@ -150,38 +191,20 @@ class UnbabelizerApp(App[None]):
     async def action_clear(self):
         """Clear all .po and .mo files in the locale directory."""
 
-        def callback(result: Any):
+        async def callback(result: Any):
             if result is not True:
                 return
 
-            self.logger.info("Clearing translation files...", extra={"context": "unbabelizerApp.clear"})
-            with handle_exception(self, self.logger):
-                for path in self._config.locale_dir.rglob("*"):
-                    if path.is_file():
-                        self.logger.debug("Removing file", extra={"path": path, "context": "unbabelizerApp.clear"})
-                        path.unlink()
-
-                for path in self._config.locale_dir.rglob("*"):
-                    if path.is_dir() and not any(path.iterdir()):
-                        self.logger.debug(
-                            "Removing empty directory", extra={"path": path, "context": "unbabelizerApp.clear"}
-                        )
-                        path.rmdir()
-
-                self.notify(_("All translation files cleared."), timeout=3, title=_("✅ Success"))
-                self.logger.info("Translation files cleared.", extra={"context": "unbabelizerApp.clear"})
+            # The callback runs on the app's message loop, the locks are awaited in a worker instead
+            self.flow_clear()
 
         await self.push_screen(ConfirmInevitable(), callback=callback)
 
     async def action_run_workflow(self):
         """Run the selected workflow actions."""
         self.logger.info("Running workflow actions...", extra={"context": "unbabelizerApp.run_workflow"})
-        selection_list = await wait_for_element(
-            self.query_one,
-            selector=f"#workflow_selection_list_{self._config.dest_lang[self._current_lang_idx]}",
-            expect_type=SelectionList,
-        )
-        selections = [f"{option}" for option in selection_list.selected]
+        selection_list = self._selection_lists[self.current_lang]
+        selections = list(map(str, selection_list.selected))
         if not selections:
             self.logger.warning("No actions selected to run", extra={"context": "unbabelizerApp.run_workflow"})
             self.notify(_("No actions selected to run."), timeout=3, title=_("⚠️ Warning"))
@@ -191,32 +214,83 @@ class UnbabelizerApp(App[None]):
         self.logger.debug(
             "Selected actions:", extra={"selections": selections, "context": "unbabelizerApp.run_workflow"}
         )
-        progress_bar = await wait_for_element(
-            self.query_one,
-            selector=f"#progress_bar_{self._config.dest_lang[self._current_lang_idx]}",
-            expect_type=ProgressBar,
-        )
+        progress_bar = self._progress_bars[self.current_lang]
         progress_bar.update(total=100, progress=0)
-        actions = {
-            SubCommands.EXTRACT_UPDATE.value.name: self.flow_extract_and_update,
-            SubCommands.TRANSLATE.value.name: self.flow_translate_pofile,
-            SubCommands.REVIEW.value.name: self.flow_review_pofile,
-            SubCommands.COMPILE.value.name: self.flow_compile_translations,
-        }
-        for action in actions:
-            if action in selections:
+        selected = frozenset(selections)
+        workers: List[Worker[Any]] = []
+        for action, flow in self._workflow_actions:
+            if action in selected:
                 self.logger.info(f"Starting action: {action}", extra={"context": "unbabelizerApp.run_workflow"})
-                actions[action]()
-                progress_bar.advance(100 // (len(selections) or 1))
+                workers.append(flow())
 
-        progress_bar.update(total=100, progress=100)
+        self.flow_complete_progress(progress_bar, workers)
         self._workflow_running = False
 
+    async def action_run_workflow_all(self):
+        """Run the selected non-interactive workflow actions for all destination languages."""
+        self.logger.info("Running workflow for all languages...", extra={"context": "unbabelizerApp.run_workflow_all"})
+        selection_list = self._selection_lists[self.current_lang]
+        selections = set(map(str, selection_list.selected))
+        skipped = [
+            sc.command_description for sc in SubCommands if sc.command_requires_ui and sc.command_name in selections
+        ]
+        if skipped:
+            self.logger.warning(
+                "Interactive actions are skipped when running for all languages",
+                extra={"skipped": skipped, "context": "unbabelizerApp.run_workflow_all"},
+            )
+            self.notify(
+                _("Interactive actions are skipped for all languages: {actions}").format(actions=", ".join(skipped)),
+                timeout=3,
+                title=_("⚠️ Warning"),
+            )
+
+        selections -= {sc.command_name for sc in SubCommands if sc.command_requires_ui}
+        if not selections:
+            self.logger.warning("No actions selected to run", extra={"context": "unbabelizerApp.run_workflow_all"})
+            self.notify(_("No actions selected to run."), timeout=3, title=_("⚠️ Warning"))
+            return
+
+        for progress_bar in self._progress_bars.values():
+            progress_bar.update(total=100, progress=0)
+        # Block the other actions until the worker has finished every language, it clears the flag itself
+        self._workflow_running = True
+        self.refresh_bindings()
+        self.flow_run_workflow_all(selections)
+
     async def action_quit(self):
         """Quit the application."""
         self.logger.info("Quitting application...", extra={"context": "unbabelizerApp.quit"})
         self.exit()
 
+    @staticmethod
+    def run_action_clear(logger: Logger, config: Config):
+        """Remove all files and empty directories below the locale directory."""
+        removed_files: List[str] = []
+        removed_dirs: List[str] = []
+
+        def clear_dir(path: str | Path):
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    # DirEntry caches the entry type, so no additional stat call is made per entry
+                    if entry.is_dir(follow_symlinks=False):
+                        clear_dir(entry.path)
+                        try:
+                            os.rmdir(entry.path)
+                        except OSError:
+                            continue  # Not empty (e.g. a file was created in the meantime)
+
+                        removed_dirs.append(entry.path)
+                    else:
+                        os.unlink(entry.path)
+                        removed_files.append(entry.path)
+
+        try:
+            clear_dir(config.locale_dir)
+        finally:
+            logger.debug("Removed files", extra={"paths": removed_files, "context": "unbabelizerApp.clear"})
+            logger.debug("Removed empty directories", extra={"paths": removed_dirs, "context": "unbabelizerApp.clear"})
+
     @staticmethod
     def run_action_extract_and_update(
         logger: Logger, config: Config, current_lang_idx: int, potfile_path: Path, pofile_path: Path
@@ -225,41 +299,61 @@ class UnbabelizerApp(App[None]):
         logger.info(
             "Extracting and updating translations...", extra={"context": "unbabelizerApp.flow_extract_and_update"}
         )
+        UnbabelizerApp.run_action_extract(logger, config, potfile_path)
+        UnbabelizerApp.run_action_update(logger, config, current_lang_idx, potfile_path, pofile_path)
+        logger.info(
+            "Extraction and update completed.",
+            extra={
+                "pot_path": potfile_path,
+                "po_path": pofile_path,
+                "context": "unbabelizerApp.flow_extract_and_update",
+            },
+        )
 
+    @staticmethod
+    def run_action_extract(logger: Logger, config: Config, potfile_path: Path):
+        """Extract messages from the input paths into the .pot file."""
         # Extraction (overwrite existing .pot file)
         mapping_file = config.locale_dir / "babel_mapping.txt"
         logger.debug(
             "Creating temporary Babel mapping file",
             extra={"path": mapping_file, "context": "unbabelizerApp.flow_extract_and_update"},
         )
-        mapping_file.touch()
-        mapping_file.write_text(config.mapping_file.strip() + "\n")
+        mapping_content = config.mapping_file.strip() + "\n"
+        mapping_file.write_text(mapping_content)
         logger.debug(
             "Babel mapping file content:",
-            extra={"content": mapping_file.read_text(), "context": "unbabelizerApp.flow_extract_and_update"},
+            extra={"content": mapping_content, "context": "unbabelizerApp.flow_extract_and_update"},
         )
 
         logger.debug("Running Babel extract command", extra={"context": "unbabelizerApp.flow_extract_and_update"})
 
-        run_babel_cmd(
-            ["extract"]
-            + ["--project", config.title]
-            + ["--version", config.version]
-            + ["--copyright-holder", config.author]
-            + ["--last-translator", config.email]
-            + ["--sort-output"]
-            + ["-F", str(mapping_file.resolve())]
-            + ["-o", str(potfile_path)]
-            + [f"--keywords={kw}" for kw in config.keywords]
-            + (
-                ["--ignore-dirs", *(ex for ex in config.exclude_patterns)]
-                + ["--input-paths", *(str(i.resolve()) for i in config.input_paths)]
-                if config.exclude_patterns
-                else [str(i.resolve()) for i in config.input_paths]
-            )
-        )
+        args = [
+            "extract",
+            "--project",
+            config.title,
+            "--version",
+            config.version,
+            "--copyright-holder",
+            config.author,
+            "--last-translator",
+            config.email,
+            "--sort-output",
+            "-F",
+            str(mapping_file.resolve()),
+            "-o",
+            str(potfile_path),
+        ]
+        args.extend(f"--keywords={kw}" for kw in config.keywords)
+        if config.exclude_patterns:
+            args.extend(("--ignore-dirs", *config.exclude_patterns, "--input-paths"))
+        args.extend(config.resolved_input_paths)
+        run_babel_cmd(args)
         mapping_file.unlink()
 
+    @staticmethod
+    def run_action_update(logger: Logger, config: Config, current_lang_idx: int, potfile_path: Path, pofile_path: Path):
+        """Update or initiate the .po file of a single destination language from the .pot file."""
         if pofile_path.exists():
             logger.debug(
                 "Updating existing .po file",
@@ -267,14 +361,21 @@ class UnbabelizerApp(App[None]):
             )
             # Update existing .po file
             run_babel_cmd(
-                ["update"]
-                + ["-D", config.domain]
-                + ["-i", str(potfile_path)]
-                + ["-d", str(config.locale_dir)]
-                + ["-l", config.dest_lang[current_lang_idx]]
-                + ["-w", str(config.line_width)]
-                + ["--init-missing"]
-                + ["--ignore-pot-creation-date"]
+                [
+                    "update",
+                    "-D",
+                    config.domain,
+                    "-i",
+                    str(potfile_path),
+                    "-d",
+                    str(config.locale_dir),
+                    "-l",
+                    config.dest_lang[current_lang_idx],
+                    "-w",
+                    str(config.line_width),
+                    "--init-missing",
+                    "--ignore-pot-creation-date",
+                ]
             )
         else:
             logger.debug(
@@ -283,71 +384,177 @@ class UnbabelizerApp(App[None]):
             )
             # Initialize new .po file
             run_babel_cmd(
-                ["init"]
-                + ["-i", str(potfile_path)]
-                + ["-d", str(config.locale_dir)]
-                + ["-l", config.dest_lang[current_lang_idx]]
-                + ["-w", str(config.line_width)]
-                + ["-D", config.domain]
+                [
+                    "init",
+                    "-i",
+                    str(potfile_path),
+                    "-d",
+                    str(config.locale_dir),
+                    "-l",
+                    config.dest_lang[current_lang_idx],
+                    "-w",
+                    str(config.line_width),
+                    "-D",
+                    config.domain,
+                ]
             )
-        logger.info(
-            "Extraction and update completed.",
-            extra={
-                "pot_path": potfile_path,
-                "po_path": pofile_path,
-                "context": "unbabelizerApp.flow_extract_and_update",
-            },
-        )
 
     @staticmethod
-    def run_action_compile_translations(logger: Logger, config: Config):
-        """Compile .po files into .mo files."""
+    def run_action_compile_translations(logger: Logger, config: Config, current_lang_idx: int | None = None):
+        """Compile .po files into .mo files.
+
+        Args:
+            current_lang_idx (int | None): Compile only the catalog of this destination language, or all if None.
+        """
         logger.info("Compiling translations...", extra={"context": "unbabelizerApp.flow_compile_translations"})
-        run_babel_cmd(["compile"] + ["-D", config.domain] + ["-d", str(config.locale_dir)])
+        args = ["compile", "-D", config.domain, "-d", str(config.locale_dir)]
+        if current_lang_idx is not None:
+            args.extend(("-l", config.dest_lang[current_lang_idx]))
+        run_babel_cmd(args)
         logger.info("Compilation completed.", extra={"context": "unbabelizerApp.flow_compile_translations"})
 
+    @staticmethod
+    def run_actions_for_language(logger: Logger, config: Config, current_lang_idx: int, selections: Set[str]):
+        """Run the selected non-interactive actions that only touch the catalog of one destination language.
+
+        The .pot file is expected to be extracted already, so that languages can be processed concurrently.
+        """
+        pofile_path = config.get_pofile_path(current_lang_idx)
+        if SubCommands.EXTRACT_UPDATE.command_name in selections:
+            UnbabelizerApp.run_action_update(logger, config, current_lang_idx, config.potfile_path, pofile_path)
+        if SubCommands.COMPILE.command_name in selections:
+            # Babel fails on a language without catalog, which is only created by extract and update
+            if not pofile_path.exists():
+                logger.warning(
+                    "No .po file to compile, skipping",
+                    extra={"path": pofile_path, "context": "unbabelizerApp.flow_run_workflow_all"},
+                )
+                return
+            UnbabelizerApp.run_action_compile_translations(logger, config, current_lang_idx)
+
     @work(group="main")
     async def flow_extract_and_update(self):
         """Extract messages and update or initiate .po files."""
-        async with self._lock:
+        lang_idx, pofile_path = self.current_lang_idx, self.pofile_path
+        async with self._lang_locks[self._config.dest_lang[lang_idx]]:
             with handle_exception(self, self.logger):
-                self.run_action_extract_and_update(
-                    self.logger,
-                    self._config,
-                    self._current_lang_idx,
-                    self.potfile_path,
-                    self.pofile_path,
-                )
+                async with self._catalog_lock:
+                    await asyncio.to_thread(
+                        self.run_action_extract_and_update,
+                        self.logger,
+                        self._config,
+                        lang_idx,
+                        self.potfile_path,
+                        pofile_path,
+                    )
                 self.notify(_("Extraction and update completed."), timeout=3, title=_("✅ Success"))
 
+    @asynccontextmanager
+    async def lock_all_catalogs(self) -> AsyncGenerator[None, None]:
+        """Hold the locks of all languages and the catalog lock.
+
+        The locks are always taken in the same order, so flows holding several of them cannot deadlock.
+        """
+        async with AsyncExitStack() as stack:
+            for lang in self._config.dest_lang:
+                await stack.enter_async_context(self._lang_locks[lang])
+            await stack.enter_async_context(self._catalog_lock)
+            yield
+
+    @work(group="main")
+    async def flow_clear(self):
+        """Delete the translation files once no other flow is using them."""
+        async with self.lock_all_catalogs():
+            self.logger.info("Clearing translation files...", extra={"context": "unbabelizerApp.clear"})
+            with handle_exception(self, self.logger):
+                await asyncio.to_thread(self.run_action_clear, self.logger, self._config)
+                self.notify(_("All translation files cleared."), timeout=3, title=_("✅ Success"))
+                self.logger.info("Translation files cleared.", extra={"context": "unbabelizerApp.clear"})
+
     @work(group="main")
     async def flow_compile_translations(self):
         """Compile .po files into .mo files."""
-        async with self._lock:
+        # The catalogs of all languages are compiled, so none of them may be written meanwhile
+        async with self.lock_all_catalogs():
             with handle_exception(self, self.logger):
-                self.run_action_compile_translations(self.logger, self._config)
+                await asyncio.to_thread(self.run_action_compile_translations, self.logger, self._config)
+
+    @work(group="main")
+    async def flow_run_workflow_all(self, selections: Set[str]):
+        """Run the selected non-interactive actions for all destination languages concurrently."""
+        try:
+            async with self.lock_all_catalogs():
+                with handle_exception(self, self.logger):
+                    # The .pot file is shared by all languages, extract it once before fanning out
+                    if SubCommands.EXTRACT_UPDATE.command_name in selections:
+                        await asyncio.to_thread(self.run_action_extract, self.logger, self._config, self.potfile_path)
+
+                    # Wait for every language, the locks must not be released while other threads still write catalogs
+                    results = await asyncio.gather(
+                        *(
+                            asyncio.to_thread(self.run_actions_for_language, self.logger, self._config, idx, selections)
+                            for idx in range(len(self._config.dest_lang))
+                        ),
+                        return_exceptions=True,
+                    )
+                    failed = False
+                    escalated: BaseException | None = None
+                    for lang, result in zip(self._config.dest_lang, results):
+                        if isinstance(result, Exception):
+                            failed = True
+                            # Report every failed language, not only the first one
+                            with handle_exception(self, self.logger):
+                                raise result
+                        elif isinstance(result, BaseException):
+                            escalated = result
+                        else:
+                            self._progress_bars[lang].update(total=100, progress=100)
+                    # Exceptions handle_exception does not catch propagate as in the other flows, once all are reported
+                    if escalated is not None:
+                        raise escalated
+                    if failed:
+                        return
+
+                    self.notify(_("Workflow completed for all languages."), timeout=3, title=_("✅ Success"))
+                    self.logger.info(
+                        "Workflow completed for all languages",
+                        extra={"context": "unbabelizerApp.flow_run_workflow_all"},
+                    )
+        finally:
+            # Set by action_run_workflow_all, the other actions stay blocked until every language is done
+            self._workflow_running = False
+            self.refresh_bindings()
+
+    @work(group="progress")
+    async def flow_complete_progress(self, progress_bar: ProgressBar, workers: List[Worker[Any]]):
+        """Fill the progress bar once all workflow workers have finished."""
+        # The flows report failures themselves, only their completion matters here
+        await asyncio.gather(*(worker.wait() for worker in workers), return_exceptions=True)
+        progress_bar.update(total=100, progress=100)
 
     @work(group="main")
     async def flow_translate_pofile(self):
         """Translate the .po file using Google Translate."""
-        self.logger.info("Pushing translation screen", extra={"context": "unbabelizerApp.flow_translate_po"})
-        await self._lock.acquire()
-        await self.push_screen(
-            Translator(
-                self.pofile_path,
-                self._config.get_translation_config(self._current_lang_idx),  # pyright: ignore[reportArgumentType]
-            ),
-            callback=lambda _: self._lock.release(),
-        )
-        self.logger.info("Translation screen pushed", extra={"context": "unbabelizerApp.flow_translate_po"})
+        from .modals.po_translation_sc import Translator
+
+        lang_idx, pofile_path = self.current_lang_idx, self.pofile_path
+        async with self._lang_locks[self._config.dest_lang[lang_idx]]:
+            self.logger.info("Pushing translation screen", extra={"context": "unbabelizerApp.flow_translate_po"})
+            await self.push_screen_wait(
+                Translator(
+                    pofile_path,
+                    self._config.get_translation_config(lang_idx),  # pyright: ignore[reportArgumentType]
+                )
+            )
+            self.logger.info("Translation screen dismissed", extra={"context": "unbabelizerApp.flow_translate_po"})
 
     @work(group="main")
     async def flow_review_pofile(self):
         """Review and edit the .po file."""
-        self.logger.info("Pushing PO review screen", extra={"context": "unbabelizerApp.flow_review_po"})
-        await self._lock.acquire()
-        await self.push_screen(
-            POReviewScreen(self.pofile_path),
-            callback=lambda _: self._lock.release(),
-        )
-        self.logger.info("PO review screen dismissed", extra={"context": "unbabelizerApp.flow_review_po"})
+        from .modals.po_review_sc import POReviewScreen
+
+        pofile_path = self.pofile_path
+        async with self._lang_locks[self.current_lang]:
+            self.logger.info("Pushing PO review screen", extra={"context": "unbabelizerApp.flow_review_po"})
+            await self.push_screen_wait(POReviewScreen(pofile_path))
+            self.logger.info("PO review screen dismissed", extra={"context": "unbabelizerApp.flow_review_po"})
@@ -1,21 +1,24 @@
 import sys
-import traceback
 
-from pydantic import ValidationError
 
-from .translation import setup_translation
+def main(args: list[str] | None = None):
+    """Entry point for the unbabelizer CLI application."""
+    from .translation import setup_translation
 
-setup_translation()
+    # Translated strings are evaluated at import time, so the translation must be installed first
+    setup_translation()
 
-from .app import UnbabelizerApp
-from .config import Config, logger
-from .types.subcommand import SubCommands
+    from pydantic import ValidationError
 
+    from .config import Config, get_logger
+    from .types.subcommand import SubCommands
 
-def main(args: list[str] | None = None):
-    """Entry point for the unbabelizer CLI application."""
     try:
         config = Config.build(args)
+        logger = get_logger()
+        # Deferred until the configuration is valid, so that --help and configuration errors skip the Textual import
+        from .app import UnbabelizerApp
+
         logger.info("Running unbabelizerApp with config:", extra={"context": "cli.main", "config": config})
         # Non-interactive (headless) mode: run non-UI workflow actions and exit
         if config.noninteractive:
@@ -55,31 +58,32 @@ def main(args: list[str] | None = None):
         app.run()
         logger.info("unbabelizerApp has terminated gracefully.")
     except ValidationError as ve:
+        errors = ve.errors()
+        logger = get_logger()
         logger.error(
             "Configuration validation error",
-            extra={
-                "context": "cli.main",
-                "errors": ve.errors(),
-                "trace": traceback.format_exc(),
-                "exception": str(ve),
-            },
+            exc_info=ve,
+            extra={"context": "cli.main", "errors": errors},
         )
-        print("Configuration Error:", file=sys.stderr)
-        for err in ve.errors():
-            print(
-                ' - invalid field: "{field}", reason: "{reason}"'.format(
-                    field=".".join(str(l) for l in err.get("loc", [])),
+        sys.stderr.write(
+            "Configuration Error:\n"
+            + "".join(
+                ' - invalid field: "{field}", reason: "{reason}"\n'.format(
+                    field=".".join(map(str, err.get("loc", ()))),
                     reason=err.get("msg", ""),
-                ),
-                file=sys.stderr,
+                )
+                for err in errors
             )
+        )
         sys.exit(1)
 
     except Exception as e:
+        logger = get_logger()
         logger.critical(
             "An unhandled exception occurred: %s",
             str(e),
-            extra={"context": "cli.main", "trace": traceback.format_exc()},
+            exc_info=e,
+            extra={"context": "cli.main"},
         )
         print(
             "An unexpected error occurred: {error}. Check details in {log_path}.".format(
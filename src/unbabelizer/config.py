@@ -1,19 +1,17 @@
 import argparse
 import sys
-import tomllib
-from importlib.metadata import version as pkg_version
+from functools import cache, cached_property, lru_cache, partial
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Dict, List, Literal, Optional, overload
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, NamedTuple, Optional, Tuple, overload
 
-import jmespath
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .log import Logger
 from .types.subcommand import SubCommandChoices, SubCommands
 from .types.translation_service.config import Presets as TranslationServicePresets
-from .types.translation_service.config import TranslationServiceConfig
+from .types.translation_service.config import Proxies, TranslationServiceConfig
 from .types.translation_service.services import TranslationServices
-from .utils import get_base_type
+from .utils import get_base_type, parse_dotted_path, search_dotted_path
 
 if TYPE_CHECKING:
 
@@ -21,10 +19,37 @@ if TYPE_CHECKING:
     def _(message: str) -> str: ...  # pyright: ignore[reportInconsistentOverload, reportNoOverloadImplementation]
 
 
-logger = Logger()
+@cache
+def get_logger() -> Logger:
+    """Return the application logger, creating it on first use."""
+    return Logger()
+
+
+def __getattr__(name: str) -> Any:
+    # The logger opens its log file on creation, so it is only created once it is accessed
+    if name == "logger":
+        return get_logger()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+_OVERRIDE_HELP_TEMPLATE = _('(overrides pyproject.toml setting: "{config_field}")')
+
+
+class _FieldSchema(NamedTuple):
+    """Static command line and pyproject.toml metadata of a config field."""
+
+    name: str
+    flag: str
+    choices: List[Any] | None
+    nargs: str | None
+    pyproject_query: str | None
+    base_type: Any
+    help_text: str
 
 
 class Presets(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     workflow_actions: List[SubCommandChoices] = Field(
         default=["extract_update", "review", "compile"],
         description=_("Actions to perform in the workflow"),
@@ -175,7 +200,6 @@ class Config(Presets):
             "argparse.flag": "--api-key-type",
             "argparse.choices": ["free", "paid"],
         },
-        pattern="^(free|paid)$",
     )
     model: Optional[str] = Field(
         default=None,
@@ -197,6 +221,16 @@ class Config(Presets):
             default_translation_service=self.default_translation_service,
         )
 
+    @cached_property
+    def resolved_input_paths(self) -> List[str]:
+        """Absolute paths to search for source files, as passed to Babel."""
+        return [str(path.resolve()) for path in self.input_paths]
+
+    @cached_property
+    def proxies(self) -> Proxies | None:
+        """Proxy URLs by scheme for the translation service, None if no proxy is configured."""
+        return {k: v for k, v in (("http", self.http_proxy), ("https", self.https_proxy)) if v} or None
+
     @property
     def potfile_path(self) -> Path:
         """Path to the .pot file."""
@@ -219,59 +253,72 @@ class Config(Presets):
             "target": self.dest_lang[dest_lang_index],
             "api_key": self.api_key,
             "api_key_type": self.api_key_type,
-            "proxies": {k: v for k, v in {"http": self.http_proxy, "https": self.https_proxy}.items() if v} or None,
+            # Copied, since the translation screen edits the proxies of its configuration in place
+            "proxies": {**self.proxies} if self.proxies else None,
             "model": self.model,
             "region": self.region,
             "presets": self.presets,
         }
 
     @classmethod
-    def source_cli_args(cls, args: List[str]) -> Dict[str, Any]:
-        """Parse command line arguments to create a Config instance."""
-        parser = argparse.ArgumentParser(
-            description=_("unbabelizer {version} configuration").format(version=pkg_version("unbabelizer"))
-        )
+    @cache
+    def _schema_table(cls) -> List[_FieldSchema]:
+        """Collect the metadata of the model fields, once per class."""
+        table: List[_FieldSchema] = []
         for name, field in cls.model_fields.items():
             schema = (  # pyright: ignore[reportUnknownVariableType]
                 field.json_schema_extra  # pyright: ignore[reportUnknownMemberType]
                 if isinstance(field.json_schema_extra, dict)
                 else {}
             )
-
-            flag = schema.get(  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
-                "argparse.flag", f"--{name.replace('_', '-')}"
-            )
             choices = schema.get(  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
                 "argparse.choices", None
             )
-            nargs = schema.get(  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
-                "argparse.nargs", None
-            )
-            config_field = schema.get(  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
-                "pyproject.toml", None
-            )
             if choices is not None and not isinstance(choices, list):
                 choices = [choices]  # pyright: ignore[reportUnknownVariableType]
 
-            # Build argparse kwargs, but use store_true for boolean flags (no argument expected)
-            base_type = get_base_type(field.annotation)
-            help_text = (
-                (field.description or "")
-                + (
-                    " "
-                    + _('(overrides pyproject.toml setting: "{config_field}")').format(
-                        config_field=config_field  # pyright: ignore[reportUnknownArgumentType]
-                    )
+            pyproject_query = schema.get(  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+                "pyproject.toml", None
+            )
+            config_field = pyproject_query if isinstance(pyproject_query, str) else None
+            help_text = field.description or ""
+            if config_field:
+                help_text += " " + _OVERRIDE_HELP_TEMPLATE.format(config_field=config_field)
+
+            table.append(
+                _FieldSchema(
+                    name=name,
+                    flag=schema.get(  # pyright: ignore[reportUnknownMemberType, reportArgumentType]
+                        "argparse.flag", f"--{name.replace('_', '-')}"
+                    ),
+                    choices=choices,  # pyright: ignore[reportUnknownArgumentType]
+                    nargs=schema.get(  # pyright: ignore[reportUnknownMemberType, reportArgumentType]
+                        "argparse.nargs", None
+                    ),
+                    pyproject_query=config_field,
+                    base_type=get_base_type(field.annotation),
+                    help_text=help_text,
                 )
-                if config_field
-                else (field.description or "")
             )
 
+        return table
+
+    @classmethod
+    @cache
+    def _build_parser(cls) -> argparse.ArgumentParser:
+        """Build the argument parser from the model fields, once per class."""
+        from importlib.metadata import version as pkg_version
+
+        parser = argparse.ArgumentParser(
+            description=_("unbabelizer {version} configuration").format(version=pkg_version("unbabelizer"))
+        )
+        for name, flag, choices, nargs, _pyproject_query, base_type, help_text in cls._schema_table():
+            # Build argparse kwargs, but use store_true for boolean flags (no argument expected)
             arg_kwargs: Dict[str, Any] = {
                 "help": help_text,
                 "default": None,
                 "nargs": nargs,
-                "choices": choices,  # pyright: ignore[reportUnknownArgumentType]
+                "choices": choices,
             }
 
             if base_type is bool:
@@ -283,39 +330,61 @@ class Config(Presets):
                 arg_kwargs["type"] = base_type
 
             parser.add_argument(
-                flag,  # pyright: ignore[reportArgumentType]
+                flag,
                 dest=name,
                 **{k: v for k, v in arg_kwargs.items() if v is not None},
             )
 
-        parsed_args = parser.parse_args(args)
+        return parser
+
+    @classmethod
+    def source_cli_args(cls, args: List[str]) -> Dict[str, Any]:
+        """Parse command line arguments to create a Config instance."""
+        parsed_args = cls._build_parser().parse_args(args)
         field_values = {k: v for k, v in vars(parsed_args).items() if v is not None}
-        logger.debug("Parsed CLI args", extra={"context": "Config.source_cli_args", "data": field_values})
+        get_logger().debug("Parsed CLI args", extra={"context": "Config.source_cli_args", "data": field_values})
         return field_values
 
     @classmethod
-    def source_pyproject_toml(cls, file_path: Path) -> Dict[str, Any]:
-        """Load configuration from pyproject.toml using jmespath."""
-        if not file_path.exists() or not file_path.is_file():
-            return {}
+    @cache
+    def _compile_pyproject_queries(cls) -> Dict[str, Tuple[str, Callable[[Any], Any]]]:
+        """Compile the JMESPath query of every model field, once per class.
+
+        Plain dotted paths are walked directly, anything else is handed to jmespath.
+        """
+        queries: Dict[str, Tuple[str, Callable[[Any], Any]]] = {}
+        for field_schema in cls._schema_table():
+            name = field_schema.name
+            jmespath_query = field_schema.pyproject_query or name
+            path = parse_dotted_path(jmespath_query)
+            if path is not None:
+                queries[name] = (jmespath_query, partial(search_dotted_path, path))
+            else:
+                import jmespath
+
+                queries[name] = (
+                    jmespath_query,
+                    jmespath.compile(jmespath_query).search,  # pyright: ignore[reportUnknownMemberType]
+                )
+
+        return queries
+
+    @classmethod
+    @lru_cache(maxsize=4)
+    def _extract_pyproject_toml(cls, file_path: Path, mtime_ns: int, size: int) -> Dict[str, Any]:
+        """Extract the configuration from a pyproject.toml, cached by its modification time and size."""
+        # Only needed when a pyproject.toml is present, keep it off the startup path otherwise
+        import tomllib
 
-        pyproject_data = tomllib.loads(file_path.read_text())
+        logger = get_logger()
+        with file_path.open("rb") as file:
+            pyproject_data = tomllib.load(file)
         logger.debug(
             "Loaded pyproject.toml data:", extra={"context": "Config.source_pyproject_toml", "data": pyproject_data}
         )
         field_values: Dict[str, Any] = {}
-        for name, field in cls.model_fields.items():
-            schema = (  # pyright: ignore[reportUnknownVariableType]
-                field.json_schema_extra  # pyright: ignore[reportUnknownMemberType]
-                if isinstance(field.json_schema_extra, dict)
-                else {}
-            )
-            jmespath_query = schema.get(  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
-                "pyproject.toml", name
-            )
-            value = jmespath.search(  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
-                jmespath_query, pyproject_data  # pyright: ignore[reportArgumentType]c
-            )
+        for name, (jmespath_query, search) in cls._compile_pyproject_queries().items():
+            value = search(pyproject_data)
             logger.debug(
                 "JMESPath query result",
                 extra={  # pyright: ignore[reportUnknownArgumentType]
@@ -334,10 +403,22 @@ class Config(Presets):
         )
         return field_values
 
+    @classmethod
+    def source_pyproject_toml(cls, file_path: Path) -> Dict[str, Any]:
+        """Load configuration from pyproject.toml using jmespath."""
+        if not file_path.exists() or not file_path.is_file():
+            return {}
+
+        stat = file_path.stat()
+        # Copied, since callers merge other sources into the returned values
+        return dict(cls._extract_pyproject_toml(file_path.resolve(), stat.st_mtime_ns, stat.st_size))
+
     @classmethod
     def build(cls, args: List[str] | None) -> "Config":
         """Validate and create a Config instance from source data."""
+        # Parse the command line first, argparse exits on --help before pyproject.toml is read
+        cli_data = cls.source_cli_args(args or sys.argv[1:])
         config_data = cls.source_pyproject_toml(Path("pyproject.toml"))
-        config_data.update(cls.source_cli_args(args or sys.argv[1:]))
-        logger.info("Validated config data", extra={"context": "Config.build", "data": config_data})
+        config_data.update(cli_data)
+        get_logger().info("Validated config data", extra={"context": "Config.build", "data": config_data})
         return cls.model_validate(config_data)
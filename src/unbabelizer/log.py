@@ -3,6 +3,8 @@ import logging.handlers
 from pathlib import Path
 from typing import Any
 
+_LOG_DIR = Path.home() / ".unbabelizer"
+
 
 class Logger(logging.LoggerAdapter[Any]):
     """A singleton logger class for the application."""
@@ -11,19 +13,20 @@ class Logger(logging.LoggerAdapter[Any]):
         logger = logging.getLogger(log_name)
         logger.setLevel(log_level)
 
-        formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+        # The underlying logger is shared, only attach the file handler once
+        if not any(isinstance(h, logging.handlers.RotatingFileHandler) for h in logger.handlers):
+            formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 
-        log_dir = Path.home() / ".unbabelizer"
-        log_dir.mkdir(parents=True, exist_ok=True)
+            _LOG_DIR.mkdir(parents=True, exist_ok=True)
 
-        fh = logging.handlers.RotatingFileHandler(
-            log_dir / "unbabelizer.log",
-            maxBytes=20 * 1024**2,  # 20 MB
-            backupCount=1,
-        )
-        fh.setLevel(log_level)
-        fh.setFormatter(formatter)
-        logger.addHandler(fh)
+            fh = logging.handlers.RotatingFileHandler(
+                _LOG_DIR / "unbabelizer.log",
+                maxBytes=20 * 1024**2,  # 20 MB
+                backupCount=1,
+            )
+            fh.setLevel(log_level)
+            fh.setFormatter(formatter)
+            logger.addHandler(fh)
 
         super().__init__(logger)
 
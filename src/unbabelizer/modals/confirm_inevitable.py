@@ -7,7 +7,7 @@ from textual.screen import ModalScreen
 from textual.widgets import Button, Footer, Header, Static
 
 from ..log import Logger
-from ..utils import apply_styles, wait_for_element
+from ..utils import apply_styles
 
 if TYPE_CHECKING:
 
@@ -33,14 +33,17 @@ class ConfirmInevitable(ModalScreen[bool]):
 
     def compose(self) -> ComposeResult:
         """Compose the modal's layout."""
+        # Kept to focus the buttons directly, they exist as soon as the modal is mounted
+        self._ok_button = Button(_("OK"), id="ok", variant="default")
+        self._cancel_button = Button(_("Cancel"), id="cancel", variant="primary")
         yield Header()
         yield apply_styles(
             Container(
                 apply_styles(Static(_("Are you sure? This action cannot be undone.")), width="1fr"),
                 apply_styles(
                     Horizontal(
-                        Button(_("OK"), id="ok", variant="default"),
-                        Button(_("Cancel"), id="cancel", variant="primary"),
+                        self._ok_button,
+                        self._cancel_button,
                     ),
                     width="1fr",
                     height="1fr",
@@ -53,7 +56,7 @@ class ConfirmInevitable(ModalScreen[bool]):
 
     async def on_mount(self):
         """Focus the Cancel button when the modal is mounted."""
-        (await wait_for_element(self.query_one, selector="#cancel", expect_type=Button)).focus()
+        self._cancel_button.focus()
 
     async def on_button_pressed(self, event: Button.Pressed):
         """Handle button press events."""
@@ -70,8 +73,8 @@ class ConfirmInevitable(ModalScreen[bool]):
 
     async def action_focus_ok(self):
         """Focus the OK button."""
-        (await wait_for_element(self.query_one, selector="#ok", expect_type=Button)).focus()
+        self._ok_button.focus()
 
     async def action_focus_cancel(self):
         """Focus the Cancel button."""
-        (await wait_for_element(self.query_one, selector="#cancel", expect_type=Button)).focus()
+        self._cancel_button.focus()
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Dict, overload
+from typing import TYPE_CHECKING, Dict, Tuple, overload
 
 import polib
 from textual.app import ComposeResult
@@ -11,7 +11,7 @@ from ..log import Logger
 from ..types.highlighter import FnmatchHighlighter, FStringHighlighter
 from ..types.note import Note
 from ..types.po_file.tag import POFileEntryTag
-from ..utils import apply_styles, escape_control_chars, unescape_control_chars, wait_for_element, write_new_tcomment
+from ..utils import apply_styles, escape_control_chars, unescape_control_chars, write_new_tcomment
 
 if TYPE_CHECKING:
 
@@ -38,6 +38,7 @@ class POEditScreen(ModalScreen[Dict[str, str] | str]):
             parent_screen (_POEditScreenParentProtocol): The parent screen to interact with.
         """
         ModalScreen.__init__(self)  # pyright: ignore[reportUnknownMemberType]
+        self._display_values: Tuple[str, str, str | None] | None = None
         self.entry = entry
         self.idx = idx
         self._last_enter_time = 0.0  # For debouncing Enter key in Input
@@ -67,6 +68,7 @@ class POEditScreen(ModalScreen[Dict[str, str] | str]):
     def entry(self, value: polib.POEntry | None) -> None:
         """Set the PO entry being edited."""
         self._entry = value
+        self._display_values = None
 
     @property
     def idx(self) -> int | None:
@@ -77,68 +79,64 @@ class POEditScreen(ModalScreen[Dict[str, str] | str]):
     def idx(self, value: int | None) -> None:
         """Set the plural index being edited."""
         self._idx = value
+        self._display_values = None
 
-    def compose(self) -> ComposeResult:
-        """Compose the UI elements for the modal."""
-        yield apply_styles(
-            (
-                Input(
-                    value=_('Editing: "{msgid}" [{idx}]').format(
-                        msgid=escape_control_chars(
-                            self.entry.msgid  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
-                            if self.idx is None
-                            else self.entry.msgid_plural  # pyright: ignore[reportUnknownMemberType]
-                        ),
+    @property
+    def display_values(self) -> Tuple[str, str, str | None]:
+        """The escaped title, input value and note shown by the modal, computed once per entry and index."""
+        if self._display_values is None:
+            if self.entry is None:
+                self._display_values = (_("Filter entries (use * and ? as wildcards)."), "*", None)
+            else:
+                if self.idx is None:
+                    msgid = self.entry.msgid  # pyright: ignore[reportUnknownMemberType]
+                    msgstr = self.entry.msgstr  # pyright: ignore[reportUnknownMemberType]
+                else:
+                    msgid = self.entry.msgid_plural  # pyright: ignore[reportUnknownMemberType]
+                    msgstr = self.entry.msgstr_plural[self.idx]  # pyright: ignore[reportUnknownMemberType]
+
+                self._display_values = (
+                    _('Editing: "{msgid}" [{idx}]').format(
+                        msgid=escape_control_chars(msgid),  # pyright: ignore[reportUnknownArgumentType]
                         idx=self.idx if self.idx is not None else "Singular",
                     ),
-                    disabled=True,
-                    highlighter=FStringHighlighter(),
-                )
-                if self.entry is not None
-                else Input(
-                    value=_("Filter entries (use * and ? as wildcards)."),
-                    disabled=True,
-                    highlighter=FnmatchHighlighter(),
+                    escape_control_chars(msgstr),  # pyright: ignore[reportUnknownArgumentType]
+                    escape_control_chars(Note.parse_entry(self.entry)),
                 )
-            ),
-            width="1fr",
-            vertical="top",
-        )
+
+        return self._display_values
+
+    def compose(self) -> ComposeResult:
+        """Compose the UI elements for the modal."""
+        title, value, note = self.display_values
         yield apply_styles(
             Input(
-                id="poedit-input",
-                valid_empty=True,
-                value=escape_control_chars(  # pyright: ignore[reportUnknownArgumentType]
-                    (
-                        self.entry.msgstr  # pyright: ignore[reportUnknownMemberType,reportUnknownArgumentType]
-                        if self.idx is None
-                        else self.entry.msgstr_plural[self.idx]  # pyright: ignore[reportUnknownMemberType]
-                    )
-                    if self.entry is not None
-                    else "*"
-                ),
+                value=title,
+                disabled=True,
                 highlighter=FStringHighlighter() if self.entry is not None else FnmatchHighlighter(),
             ),
             width="1fr",
             vertical="top",
         )
-        if self.entry is not None:
-            comment_input = apply_styles(
-                Input(
-                    id="poedit-comment",
-                    valid_empty=True,
-                    value=escape_control_chars(  # pyright: ignore[reportUnknownArgumentType]
-                        Note.parse_entry(self.entry)
-                    ),
-                    placeholder=_("Add a note... (optional)"),
-                ),
-                width="1fr",
-                vertical="top",
+        # Kept to read the submitted values directly, they exist as soon as the modal is mounted
+        self._value_input = Input(
+            id="poedit-input",
+            valid_empty=True,
+            value=value,
+            highlighter=FStringHighlighter() if self.entry is not None else FnmatchHighlighter(),
+        )
+        yield apply_styles(self._value_input, width="1fr", vertical="top")
+        if note is not None:
+            self._comment_input = Input(
+                id="poedit-comment",
+                valid_empty=True,
+                value=note,
+                placeholder=_("Add a note... (optional)"),
             )
             # Style the comment input differently to distinguish it from the main input
-            comment_input.styles.text_style = "italic"
-            comment_input.styles.opacity = 0.85
-            yield comment_input
+            self._comment_input.styles.text_style = "italic"
+            self._comment_input.styles.opacity = 0.85
+            yield apply_styles(self._comment_input, width="1fr", vertical="top")
         yield Footer()
 
     async def key_enter(self, event: Key):
@@ -154,7 +152,7 @@ class POEditScreen(ModalScreen[Dict[str, str] | str]):
     async def filter_cells(self):
         """Filter the entries based on the input value."""
         self.logger.debug("Filtering entries", extra={"context": "POEditScreen.filter_cells"})
-        new_val = (await wait_for_element(lambda: self.query_one("#poedit-input", Input))).value.strip()
+        new_val = self._value_input.value.strip()
         self.dismiss(new_val)
         self.logger.info(
             "Filter applied and modal dismissed",
@@ -168,14 +166,14 @@ class POEditScreen(ModalScreen[Dict[str, str] | str]):
             self.logger.warning("No entry to update", extra={"context": "POEditScreen.update_cell"})
             return
 
-        new_val = (await wait_for_element(lambda: self.query_one("#poedit-input", Input))).value.strip()
+        new_val = self._value_input.value.strip()
         orig_val = unescape_control_chars(new_val)
         if self.idx is None:
             self.entry.msgstr = orig_val
         else:
             self.entry.msgstr_plural[self.idx] = orig_val  # pyright: ignore[reportUnknownMemberType]
 
-        comment_val = (await wait_for_element(lambda: self.query_one("#poedit-comment", Input))).value.strip()
+        comment_val = self._comment_input.value.strip()
         Note(unescape_control_chars(comment_val)).update_entry(self.entry)
         POFileEntryTag.REVIEWED.apply(self.entry)
         write_new_tcomment(self.entry, " [Manually edited on {timestamp}]")
@@ -1,7 +1,10 @@
+import asyncio
+import os
+import re
 from collections import Counter
-from fnmatch import fnmatch
+from fnmatch import translate
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Generator, List, Tuple, overload
+from typing import TYPE_CHECKING, Any, Generator, List, Optional, Tuple, overload
 
 from textual.app import ComposeResult
 from textual.binding import Binding
@@ -10,6 +13,7 @@ from textual.coordinate import Coordinate
 from textual.events import Key
 from textual.screen import ModalScreen
 from textual.widgets import DataTable, Footer, Header, Label
+from textual.widgets.data_table import CellDoesNotExist
 
 from ..log import Logger
 from ..types.note import Note
@@ -26,6 +30,14 @@ if TYPE_CHECKING:
     def _(message: str) -> str: ...  # pyright: ignore[reportInconsistentOverload, reportNoOverloadImplementation]
 
 
+# Messages of the edit notification, translated once instead of on every edit
+_TRANSLATION_UPDATED_TEMPLATE = (
+    _("Translation updated.") + "\n" + _('Previous value was: "{old_value}", current value is: "{new_value}".')
+)
+_EMPTY_VALUE = _("<empty>")
+_SUCCESS_TITLE = _("✅ Success")
+
+
 class POReviewScreen(ModalScreen[None], POFileHandler):
     """A modal screen for reviewing and editing PO file translations."""
 
@@ -37,6 +49,8 @@ class POReviewScreen(ModalScreen[None], POFileHandler):
         Binding(key="q", action="quit", description=_("Quit and Save"), show=True),
         Binding(key="a", action="abort", description=_("Quit without Saving"), show=True),
     ]
+    POPULATE_CHUNK_SIZE = 256
+    ALL_ROWS_FILTER: Tuple[Optional[int], str] = (None, "*")
 
     def __init__(self, po_path: Path):
         """Initialize the POReviewScreen modal.
@@ -56,20 +70,30 @@ class POReviewScreen(ModalScreen[None], POFileHandler):
             extra={
                 "context": "POReviewScreen.init",
                 "path": str(self.pofile_path),
-                "entries": len(list(self.pofile)),  # pyright: ignore[reportUnknownArgumentType, reportArgumentType]
+                "entries": len(self.pofile),  # pyright: ignore[reportUnknownArgumentType, reportArgumentType]
             },
         )
 
         self._has_changes = False
-        self.entries: List[Tuple[Any, ...]] = []
-        for entry in self.pofile:  # pyright: ignore[reportUnknownVariableType]
-            if entry.msgid_plural:  # pyright: ignore[reportUnknownMemberType]
-                for idx in sorted(  # pyright: ignore[reportUnknownVariableType]
-                    entry.msgstr_plural.keys()  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
-                ):
-                    self.entries.append((entry, idx))  # pyright: ignore[reportUnknownArgumentType]
-            else:
-                self.entries.append((entry, None))  # pyright: ignore[reportUnknownArgumentType]
+        # One row per singular entry, one row per plural form otherwise
+        self.entries: List[Tuple[Any, ...]] = [
+            (entry, idx)
+            for entry in self.pofile  # pyright: ignore[reportUnknownVariableType]
+            for idx in (
+                sorted(entry.msgstr_plural)  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+                if entry.msgid_plural  # pyright: ignore[reportUnknownMemberType]
+                else (None,)
+            )
+        ]
+
+        # Rendering escapes every string of an entry, so rows are rendered once and reused by compose and filter
+        self._rendered_rows: List[TableRow] = []
+        while len(self._rendered_rows) < len(self.entries):
+            self._rendered_rows.extend(self.render_rows(*self.get_entry_row_range(len(self._rendered_rows))))
+        # Tag counts of the rows in the table, kept up to date by populate, filter and edit instead of rescanning it
+        self._tag_counts: Counter[str] = Counter()
+        # Column and pattern of the filter the table currently shows, None while the displayed rows are not known
+        self._applied_filter: Optional[Tuple[Optional[int], str]] = None
 
         self.logger.info(
             "POReviewScreen initialized",
@@ -84,39 +108,98 @@ class POReviewScreen(ModalScreen[None], POFileHandler):
             "logger",
         )
 
-    def generate_cells(self) -> Generator[TableRow, None, None]:
-        """Generate table cells for the PO entries.
+    def get_entry_row_range(self, no: int) -> Tuple[int, int]:
+        """Return the range of rows belonging to the same PO entry as the given row.
 
+        Args:
+            no (int): The index of any row of the entry in the entries list.
         Returns:
-            Generator[TableCell, None, None]: A generator of TableCell instances.
+            Tuple[int, int]: The indices of the first and the last row of the entry.
+        """
+        entry = self.entries[no][0]
+        first = no
+        while first > 0 and self.entries[first - 1][0] is entry:
+            first -= 1
+        last = no
+        while last + 1 < len(self.entries) and self.entries[last + 1][0] is entry:
+            last += 1
+        return first, last
+
+    def render_rows(self, first: int, last: int) -> List[TableRow]:
+        """Render the table rows of a PO entry.
+
+        The tag and note belong to the whole entry, so they are computed once for all plural rows of the entry.
+
+        Args:
+            first (int): The index of the first row of the entry in the entries list.
+            last (int): The index of the last row of the entry in the entries list.
+        Returns:
+            List[TableRow]: The rendered table rows.
         """
-        for no, (entry, idx) in enumerate(self.entries):
+        entry = self.entries[first][0]
+        tag = POFileEntryTag.fish(entry, POFileEntryTag.UNKNOWN).value
+        note = escape_control_chars(Note.parse_entry(entry))
+        rows: List[TableRow] = []
+        for no in range(first, last + 1):
+            idx = self.entries[no][1]
             if idx is None:
-                yield TableRow(
-                    no,
-                    "Singular",
-                    escape_control_chars(entry.msgid),
-                    escape_control_chars(entry.msgstr),
-                    POFileEntryTag.fish(entry, POFileEntryTag.UNKNOWN).value,
-                    escape_control_chars(Note.parse_entry(entry)),
+                rows.append(
+                    TableRow(
+                        no, "Singular", escape_control_chars(entry.msgid), escape_control_chars(entry.msgstr), tag, note
+                    )
                 )
             else:
-                yield TableRow(
-                    no,
-                    f"Plural[{idx}]",
-                    escape_control_chars(entry.msgid if idx == 0 else entry.msgid_plural),
-                    escape_control_chars(entry.msgstr_plural[idx]),
-                    POFileEntryTag.fish(entry, POFileEntryTag.UNKNOWN).value,
-                    escape_control_chars(Note.parse_entry(entry)),
+                rows.append(
+                    TableRow(
+                        no,
+                        f"Plural[{idx}]",
+                        escape_control_chars(entry.msgid if idx == 0 else entry.msgid_plural),
+                        escape_control_chars(entry.msgstr_plural[idx]),
+                        tag,
+                        note,
+                    )
                 )
 
+        return rows
+
+    def refresh_rendered_rows(self, no: int):
+        """Render the rows of an edited entry again.
+
+        The tag and note belong to the whole entry, so all plural rows of the entry are refreshed.
+
+        Args:
+            no (int): The index of any row of the entry in the entries list.
+        """
+        first, last = self.get_entry_row_range(no)
+        self._rendered_rows[first : last + 1] = self.render_rows(first, last)
+
+    def get_selected_row_no(self, table: DataTable[str]) -> int:
+        """Return the index in the entries list of the row under the cursor.
+
+        Args:
+            table (DataTable[str]): The review table.
+        Returns:
+            int: The index of the entry, rows are keyed by it.
+        """
+        row_key, _column_key = table.coordinate_to_cell_key(Coordinate(table.cursor_row, 0))
+        return int(f"{row_key.value}")
+
+    def generate_cells(self) -> Generator[TableRow, None, None]:
+        """Generate table cells for the PO entries.
+
+        Returns:
+            Generator[TableCell, None, None]: A generator of TableCell instances.
+        """
+        yield from self._rendered_rows
+
     def compose(self) -> ComposeResult:
         """Compose the UI elements for the modal."""
         yield Header()
         table = DataTable[str](zebra_stripes=True)
         TableRow.define_columns(table)
-        for cell in self.generate_cells():
-            cell.add_to_table(table)
+        columns = table.ordered_columns
+        self._column_indices = {f"{column.key.value}": index for index, column in enumerate(columns)}
+        self._column_labels = tuple(f"{column.label}" for column in columns)
         yield apply_styles(ScrollableContainer(table), width="1fr", height="1fr", vertical="top")
         yield apply_styles(Label(), width="1fr", vertical="bottom")
         yield Footer()
@@ -139,19 +222,14 @@ class POReviewScreen(ModalScreen[None], POFileHandler):
             if event is not None
             else (await wait_for_element(self.query_one, selector=DataTable))
         )
+        total: int = table.row_count  # pyright: ignore[reportUnknownMemberType]
         label.update(
             "{row} / {total} | {counts}".format(
                 row=table.cursor_row + 1,  # pyright: ignore[reportUnknownMemberType]
-                total=table.row_count,  # pyright: ignore[reportUnknownMemberType]
+                total=total,
+                # The table is empty before its first rows are added, or when a filter matches nothing
                 counts=" | ".join(
-                    {
-                        f"{k}: {v} ({v/table.row_count:.1%})"  # pyright: ignore[reportUnknownMemberType]
-                        for k, v in Counter(  # pyright: ignore[reportUnknownVariableType]
-                            table.get_column(  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
-                                "tag"
-                            )
-                        ).most_common()
-                    }
+                    f"{k}: {v} ({v/total if total else 0:.1%})" for k, v in self._tag_counts.most_common()
                 ),
             )
         )
@@ -169,6 +247,26 @@ class POReviewScreen(ModalScreen[None], POFileHandler):
         table = await wait_for_element(self.query_one, selector=DataTable)
         table.focus()
         self.logger.info("DataTable focused on mount", extra={"context": "POReviewScreen.on_mount"})
+        self.run_worker(self.populate_table(table), group="populate", exclusive=True)
+
+    async def populate_table(self, table: DataTable[str]):
+        """Add the rendered rows to the table in chunks, so the screen is drawn before all rows are added.
+
+        Args:
+            table (DataTable[str]): The table to populate.
+        """
+        rows = self._rendered_rows
+        for start in range(0, len(rows), self.POPULATE_CHUNK_SIZE):
+            chunk = rows[start : start + self.POPULATE_CHUNK_SIZE]
+            TableRow.add_all_to_table(table, chunk)
+            self._tag_counts.update(row.tag for row in chunk)
+            await asyncio.sleep(0)
+
+        self._applied_filter = self.ALL_ROWS_FILTER
+        await self.on_data_table_cell_highlighted(None)
+        self.logger.info(
+            "DataTable populated", extra={"context": "POReviewScreen.populate_table", "rows": table.row_count}
+        )
 
     def edit_translation_callback(self, result: Any):
         """Edit the translation of the currently selected entry."""
@@ -197,25 +295,29 @@ class POReviewScreen(ModalScreen[None], POFileHandler):
             },
         )
         table: DataTable[str] = self.query_one(DataTable)  # pyright: ignore[reportUnknownVariableType]
+        self.refresh_rendered_rows(self.get_selected_row_no(table))
         for idx, (key, value) in enumerate(  # pyright: ignore[reportUnknownVariableType]
             result.items()  # pyright: ignore[reportUnknownArgumentType]
         ):
-            column_index = table.get_column_index(f"{key}")
+            # Keys were checked to be strings above
+            column_index = self._column_indices[key]
             coordinate = Coordinate(table.cursor_row, column_index)
             old_value = table.get_cell_at(coordinate)
             table.update_cell_at(coordinate, f"{value}", update_width=True)
             self._has_changes |= old_value != f"{value}"
-            self.run_worker(self.on_data_table_cell_highlighted(None), group="review")
+            if key == "tag" and old_value != f"{value}":
+                self._tag_counts[old_value] -= 1
+                if self._tag_counts[old_value] <= 0:
+                    del self._tag_counts[old_value]
+                self._tag_counts[f"{value}"] += 1
 
             if idx == 0:
                 self.notify(
-                    _("Translation updated.")
-                    + "\n"
-                    + _('Previous value was: "{old_value}", current value is: "{new_value}".').format(
-                        old_value=old_value or _("<empty>"), new_value=f"{value}" or _("<empty>")
+                    _TRANSLATION_UPDATED_TEMPLATE.format(
+                        old_value=old_value or _EMPTY_VALUE, new_value=f"{value}" or _EMPTY_VALUE
                     ),
                     timeout=2,
-                    title=_("✅ Success"),
+                    title=_SUCCESS_TITLE,
                 )
 
             self.logger.debug(
@@ -229,6 +331,13 @@ class POReviewScreen(ModalScreen[None], POFileHandler):
                 },
             )
 
+        # The edited row might not match the applied filter anymore, so the same filter has to be applied again
+        if self._applied_filter != self.ALL_ROWS_FILTER:
+            self._applied_filter = None
+
+        # The status label only depends on the final tag counts, so it is refreshed once for all updated cells
+        self.run_worker(self.on_data_table_cell_highlighted(None), group="review")
+
     def filter_callback(self, result: Any):
         """Filter the table rows based on a pattern.
 
@@ -244,22 +353,30 @@ class POReviewScreen(ModalScreen[None], POFileHandler):
 
         self.logger.debug("Filtering table", extra={"pattern": result, "context": "POReviewScreen.filter"})
 
-        tmp_table = DataTable[str](zebra_stripes=True)
-        TableRow.define_columns(tmp_table)
-        for cell in self.generate_cells():
-            cell.add_to_table(tmp_table)
-
         table: DataTable[str] = self.query_one(DataTable)  # pyright: ignore[reportUnknownVariableType]
         selected_col = table.cursor_column
-        column_name = list(tmp_table.columns.values())[selected_col].label
+        column_name = self._column_labels[selected_col]
 
-        table.clear()
-        for cell in self.generate_cells():
+        # "*" matches every row regardless of the column
+        filter_key = self.ALL_ROWS_FILTER if result == "*" else (selected_col, result)
+        if filter_key != self._applied_filter:
+            if filter_key == self.ALL_ROWS_FILTER:
+                matching_rows = self._rendered_rows
+            else:
+                # Same semantics as fnmatch.fnmatch, but the pattern is translated and compiled once for all rows
+                pattern = re.compile(translate(os.path.normcase(result)))
+                matching_rows = [
+                    cell
+                    for cell in self.generate_cells()
+                    if pattern.match(os.path.normcase(cell.actual_row[selected_col]))
+                ]
+            # Stop populating the table with all rows, if it is still in progress
+            self.workers.cancel_group(self, "populate")  # pyright: ignore[reportUnknownMemberType]
+            table.clear()
             with handle_exception(self, self.logger):
-                if not fnmatch(cell.actual_row[selected_col], result):
-                    continue
-
-                cell.add_to_table(table)
+                TableRow.add_all_to_table(table, matching_rows)
+                self._applied_filter = filter_key
+            self._tag_counts = Counter(cell.tag for cell in matching_rows)
 
         self.notify(
             _('Table column "{column}" filtered with "{pattern}".').format(column=column_name, pattern=result),
@@ -300,25 +417,9 @@ class POReviewScreen(ModalScreen[None], POFileHandler):
             )
             return
 
-        current_row = table.get_row_at(table.cursor_row)
-        # coordinate = Coordinate(table.cursor_row, table.cursor_column)
-
-        for entry, idx in self.entries:
-            if (
-                idx is None
-                and current_row[table.get_column_index("type")] == "Singular"
-                and escape_control_chars(entry.msgid) == current_row[table.get_column_index("msgid")]
-            ):
-                break
-            if (
-                idx is not None
-                and f"{current_row[table.get_column_index("type")]}".startswith("Plural")
-                and escape_control_chars(entry.msgid if idx == 0 else entry.msgid_plural)
-                == current_row[table.get_column_index("msgid")]
-            ):
-                break
-
-        else:
+        try:
+            entry, idx = self.entries[self.get_selected_row_no(table)]
+        except (CellDoesNotExist, IndexError, ValueError):
             self.logger.error(
                 "Could not find the selected entry in the entries list, aborting edit.",
                 extra={
@@ -344,7 +445,8 @@ class POReviewScreen(ModalScreen[None], POFileHandler):
     async def action_save(self):
         """Save the PO file."""
         self.logger.info("Saving PO file...", extra={"context": "POReviewScreen.action_save"})
-        self.pofile.save(str(self.pofile_path))  # pyright: ignore[reportUnknownMemberType]
+        # Serializing the whole catalog can take a while, so it is written without blocking the UI
+        await asyncio.to_thread(self.pofile.save, str(self.pofile_path))  # pyright: ignore[reportUnknownMemberType]
         self._has_changes = False
         self.notify(
             _('PO file saved to "{path}".').format(path=str(self.pofile_path)),
@@ -1,6 +1,7 @@
 import asyncio
+from datetime import datetime
 from pathlib import Path
-from typing import TYPE_CHECKING, Tuple, overload
+from typing import TYPE_CHECKING, Any, Iterator, Tuple, overload
 
 from textual.app import ComposeResult
 from textual.binding import Binding
@@ -15,8 +16,9 @@ from ..log import Logger
 from ..types.po_file.handler import POFileHandler
 from ..types.po_file.tag import POFileEntryTag
 from ..types.translation_service.config import TranslationServiceConfig
+from ..types.translation_service.service_definition import TranslationServiceProtocol
 from ..types.translation_service.services import TranslationServices
-from ..utils import apply_styles, correct_translation, handle_exception, wait_for_element, write_new_tcomment
+from ..utils import apply_styles, correct_translation, handle_exception, write_new_tcomment
 
 if TYPE_CHECKING:
 
@@ -24,6 +26,13 @@ if TYPE_CHECKING:
     def _(message: str) -> str: ...  # pyright: ignore[reportInconsistentOverload, reportNoOverloadImplementation]
 
 
+# Suggesters and validators hold no per-input state, so the settings inputs share them across service changes
+_HTTP_PROXY_SUGGESTER = SuggestFromList(["http://"])
+_HTTPS_PROXY_SUGGESTER = SuggestFromList(["https://"])
+_API_KEY_TYPE_SUGGESTER = SuggestFromList(["free", "paid"])
+_API_KEY_TYPE_VALIDATOR = Regex(r"^(free|paid)$", flags=0, failure_description=_("Must be 'free' or 'paid'"))
+
+
 class Translator(ModalScreen[None], POFileHandler):
     """A modal screen for translating PO files using Google Translate."""
 
@@ -34,6 +43,7 @@ class Translator(ModalScreen[None], POFileHandler):
         Binding(key="f", action="toggle_fuzzy", description=_("Toggle Fuzzy New Translations"), show=True),
         Binding(key="c", action="cancel", description=_("Cancel translation task"), show=True),
     ]
+    TRANSLATION_CONCURRENCY = 4
 
     def __init__(self, po_path: Path, translation_config: TranslationServiceConfig):
         """Initialize the Translator modal.
@@ -53,12 +63,17 @@ class Translator(ModalScreen[None], POFileHandler):
             extra={"context": "Translator.init", "path": str(po_path)},
         )
         POFileHandler.__init__(self, po_path)
+        # Plural entries advance the progress by two, one for each of msgid and msgid_plural
+        self._progress_total = sum(
+            2 if e.msgid_plural else 1  # pyright: ignore[reportUnknownMemberType]
+            for e in self.pofile  # pyright: ignore[reportUnknownVariableType]
+        )
         self.logger.info(
             "PO file loaded",
             extra={
                 "context": "Translator.init",
                 "path": str(self.pofile_path),
-                "entries": len(list(self.pofile)),  # pyright: ignore[reportUnknownArgumentType, reportArgumentType]
+                "entries": len(self.pofile),  # pyright: ignore[reportUnknownArgumentType, reportArgumentType]
             },
         )
 
@@ -86,7 +101,7 @@ class Translator(ModalScreen[None], POFileHandler):
                     placeholder=_("HTTP Proxy"),
                     value=((self._translation_config.get("proxies") or {}).get("http", "")),
                     name="proxy_http",
-                    suggester=SuggestFromList(["http://"]),
+                    suggester=_HTTP_PROXY_SUGGESTER,
                 ),
                 width="1fr",
             ),
@@ -95,7 +110,7 @@ class Translator(ModalScreen[None], POFileHandler):
                     placeholder=_("HTTPS Proxy"),
                     value=((self._translation_config.get("proxies") or {}).get("https", "")),
                     name="proxy_https",
-                    suggester=SuggestFromList(["https://"]),
+                    suggester=_HTTPS_PROXY_SUGGESTER,
                 ),
                 width="1fr",
             ),
@@ -134,8 +149,8 @@ class Translator(ModalScreen[None], POFileHandler):
                     placeholder=_('API Key Type ("free" or "paid")'),
                     value=self._translation_config.get("api_key_type") or "",
                     name="api_key_type",
-                    suggester=SuggestFromList(["free", "paid"]),
-                    validators=(Regex(r"^(free|paid)$", flags=0, failure_description=_("Must be 'free' or 'paid'")),),
+                    suggester=_API_KEY_TYPE_SUGGESTER,
+                    validators=(_API_KEY_TYPE_VALIDATOR,),
                     validate_on=("submitted", "changed"),
                 ),
                 width="1fr",
@@ -144,6 +159,26 @@ class Translator(ModalScreen[None], POFileHandler):
 
     def compose(self) -> ComposeResult:
         """Compose the UI elements for the modal."""
+        # Kept to read and update the widgets directly, they exist as soon as the modal is mounted
+        self._override_switch = Switch(
+            id="override_translations",
+            value=self._translation_config["presets"].get("override_existing_translations") or False,
+        )
+        self._fuzzy_switch = Switch(id="fuzzy_translations", value=True)
+        self._switches = {"override_translations": self._override_switch, "fuzzy_translations": self._fuzzy_switch}
+        self._service_select = Select(
+            ((s.translation_service_name, s.value) for s in TranslationServices),
+            value=TranslationServices(
+                TranslationServices.from_service_name(
+                    self._translation_config["presets"].get("default_translation_service")
+                    or TranslationServices.GOOGLE_TRANSLATE.translation_service_name
+                )
+            ).value,
+            id="translation_service",
+            prompt=_("Select Translation Service"),
+        )
+        self._settings_container = ScrollableContainer(*self.compose_proxies(), id="translator_settings")
+        self._progressbar = ProgressBar(total=self._progress_total)
         yield Header()
 
         def compose_switches() -> ComposeResult:
@@ -152,14 +187,7 @@ class Translator(ModalScreen[None], POFileHandler):
                 apply_styles(
                     Input(value=_("Override existing translations:"), disabled=True), width="2fr", vertical="top"
                 ),
-                apply_styles(
-                    Switch(
-                        id="override_translations",
-                        value=self._translation_config["presets"].get("override_existing_translations") or False,
-                    ),
-                    width="1fr",
-                    vertical="top",
-                ),
+                apply_styles(self._override_switch, width="1fr", vertical="top"),
             )
 
             yield HorizontalGroup(
@@ -171,43 +199,15 @@ class Translator(ModalScreen[None], POFileHandler):
                     width="2fr",
                     vertical="top",
                 ),
-                apply_styles(Switch(id="fuzzy_translations", value=True), width="1fr", vertical="top"),
+                apply_styles(self._fuzzy_switch, width="1fr", vertical="top"),
             )
 
         yield apply_styles(
             ScrollableContainer(
                 *compose_switches(),
-                apply_styles(
-                    Select(
-                        ((s.translation_service_name, s.value) for s in TranslationServices),
-                        value=TranslationServices(
-                            TranslationServices.from_service_name(
-                                self._translation_config["presets"].get("default_translation_service")
-                                or TranslationServices.GOOGLE_TRANSLATE.translation_service_name
-                            )
-                        ).value,
-                        id="translation_service",
-                        prompt=_("Select Translation Service"),
-                    ),
-                    width="1fr",
-                    vertical="top",
-                ),
-                apply_styles(
-                    ScrollableContainer(*self.compose_proxies(), id="translator_settings"),
-                    width="1fr",
-                    vertical="top",
-                    height="10fr",
-                ),
-                apply_styles(
-                    ProgressBar(
-                        total=sum(
-                            1 + (1 if e.msgid_plural else 0)  # pyright: ignore[reportUnknownMemberType]
-                            for e in self.pofile  # pyright: ignore[reportUnknownVariableType]
-                        )
-                    ),
-                    vertical="bottom",
-                    width="1fr",
-                ),
+                apply_styles(self._service_select, width="1fr", vertical="top"),
+                apply_styles(self._settings_container, width="1fr", vertical="top", height="10fr"),
+                apply_styles(self._progressbar, vertical="bottom", width="1fr"),
             ),
             vertical="top",
             width="1fr",
@@ -216,8 +216,7 @@ class Translator(ModalScreen[None], POFileHandler):
 
     async def apply_translation_settings(self):
         """Apply the translation settings from the input fields."""
-        settings_container = await wait_for_element(lambda: self.query_one("#translator_settings", ScrollableContainer))
-        inputs = settings_container.query(Input)
+        inputs = self._settings_container.query(Input)
         for input_widget in inputs:
             match input_widget.name:
                 case "region" | "model" | "api_key" | "api_key_type":
@@ -261,7 +260,7 @@ class Translator(ModalScreen[None], POFileHandler):
             )
             return
 
-        settings_container = await wait_for_element(lambda: self.query_one("#translator_settings", ScrollableContainer))
+        settings_container = self._settings_container
         selected_service = TranslationServices(event.value).translation_service_protocol
         await settings_container.remove_children()
         if selected_service.needs_api_key():
@@ -289,7 +288,7 @@ class Translator(ModalScreen[None], POFileHandler):
             return
 
         self.logger.debug(f"Toggling {checkbox_id}", extra={"context": f"Translator.action_toggle_{checkbox_id}"})
-        checkbox = await wait_for_element(lambda: self.query_one(f"#{checkbox_id}", Switch))
+        checkbox = self._switches[checkbox_id]
         checkbox.value = not checkbox.value
         self.logger.info(
             f"{checkbox_id} set to",
@@ -351,16 +350,99 @@ class Translator(ModalScreen[None], POFileHandler):
             },
         )
 
+    async def translate_entries(
+        self,
+        translator: TranslationServiceProtocol,
+        entries: Iterator[Any],
+        progressbar: ProgressBar,
+        override_existing: bool,
+        mark_as_fuzzy: bool,
+        tcomment: str,
+    ):
+        """Translate the PO entries taken from the given iterator until it is exhausted.
+
+        Args:
+            translator (TranslationServiceProtocol): The translator to use, it must not be shared with other workers.
+            entries (Iterator[Any]): The PO entries, shared with the other workers.
+            progressbar (ProgressBar): The progress bar to advance.
+            override_existing (bool): Whether to translate entries which are already translated.
+            mark_as_fuzzy (bool): Whether to mark new translations as fuzzy instead of unconfirmed.
+            tcomment (str): The translator comment to add to translated entries.
+        """
+        # The entries are updated in place, they are the same objects as in the PO file
+        for entry in entries:
+            changed = False
+            if entry.msgid_plural:  # pyright: ignore[reportUnknownMemberType]
+                if override_existing or not all(
+                    entry.msgstr_plural.values()  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+                ):
+                    entry.msgstr_plural = {
+                        index: correct_translation(
+                            elem,  # type: ignore[reportUnknownArgumentType]
+                            (
+                                await translator.translate(
+                                    elem,  # type: ignore[reportUnknownArgumentType]
+                                )
+                            ),
+                        )
+                        for index, elem in enumerate(  # pyright: ignore[reportUnknownVariableType]
+                            (
+                                entry.msgid,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+                                entry.msgid_plural,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+                            )
+                        )
+                    }
+                    self.logger.debug(
+                        "Translated plural entry",
+                        extra={
+                            "msgid": entry.msgid,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+                            "msgid_plural": entry.msgid_plural,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+                            "flags": entry.flags,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+                            "context": "Translator.translate_po",
+                        },
+                    )
+                    changed = True
+                progressbar.advance(2)
+                await asyncio.sleep(0)
+
+            elif entry.msgid:  # pyright: ignore[reportUnknownMemberType]
+                if override_existing or not entry.msgstr:  # pyright: ignore[reportUnknownMemberType]
+                    entry.msgstr = correct_translation(
+                        entry.msgid,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+                        (
+                            await translator.translate(  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType, reportArgumentType]
+                                entry.msgid,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+                            )
+                        ),
+                    )
+                    self.logger.debug(
+                        "Translated singular entry",
+                        extra={
+                            "msgid": entry.msgid,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+                            "msgstr": entry.msgstr,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+                            "context": "Translator.translate_po",
+                        },
+                    )
+                    changed = True
+                progressbar.advance(1)
+                await asyncio.sleep(0)
+
+            if changed:
+                write_new_tcomment(entry, tcomment)  # pyright: ignore[reportUnknownArgumentType]
+                (POFileEntryTag.FUZZY if mark_as_fuzzy else POFileEntryTag.UNCONFIRMED).apply(
+                    entry,  # pyright: ignore[reportUnknownMemberType,reportUnknownArgumentType]
+                )
+
     async def translate_pofile(self):
         """Translate the PO file using Google Translate."""
         self.logger.info("Translating PO file...", extra={"context": "Translator.translate_po"})
 
         self._translating = True
         self.refresh_bindings()
-        progressbar = await wait_for_element(lambda: self.query_one(ProgressBar))
-        override_existing = (await wait_for_element(lambda: self.query_one("#override_translations", Switch))).value
-        mark_as_fuzzy = (await wait_for_element(lambda: self.query_one("#fuzzy_translations", Switch))).value
-        selected_value = (await wait_for_element(self.query_one, selector=Select)).value
+        progressbar = self._progressbar
+        override_existing = self._override_switch.value
+        mark_as_fuzzy = self._fuzzy_switch.value
+        selected_value = self._service_select.value
 
         selected_service = (
             TranslationServices(selected_value)
@@ -377,7 +459,12 @@ class Translator(ModalScreen[None], POFileHandler):
             },
         )
         with handle_exception(self, self.logger):
-            translator = selected_service.translation_service_protocol(self._translation_config)  # type: ignore[reportArgumentType]
+            # The translation services block on their requests in worker threads, so several entries are translated
+            # at once. Every worker gets its own translator, because the translators keep request state per instance.
+            translators = [
+                selected_service.translation_service_protocol(self._translation_config)  # type: ignore[reportArgumentType]
+                for _worker_no in range(self.TRANSLATION_CONCURRENCY)
+            ]
 
             self.notify(
                 _("Translating PO file... This may take a while depending on the file size."),
@@ -385,84 +472,30 @@ class Translator(ModalScreen[None], POFileHandler):
                 title=_("⏳ Translation Started"),
             )
 
-            for (
-                idx,
-                entry,  # pyright: ignore[reportUnknownVariableType]
-            ) in enumerate(self.pofile):
-                changed = False
-                if entry.msgid_plural:  # pyright: ignore[reportUnknownMemberType]
-                    if override_existing or not all(
-                        entry.msgstr_plural.values()  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
-                    ):
-                        entry.msgstr_plural = {
-                            index: correct_translation(
-                                elem,  # type: ignore[reportUnknownArgumentType]
-                                (
-                                    await translator.translate(
-                                        elem,  # type: ignore[reportUnknownArgumentType]
-                                    )
-                                ),
-                            )
-                            for index, elem in enumerate(  # pyright: ignore[reportUnknownVariableType]
-                                (
-                                    entry.msgid,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
-                                    entry.msgid_plural,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
-                                )
-                            )
-                        }
-                        self.logger.debug(
-                            "Translated plural entry",
-                            extra={
-                                "msgid": entry.msgid,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
-                                "msgid_plural": entry.msgid_plural,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
-                                "flags": entry.flags,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
-                                "context": "Translator.translate_po",
-                            },
-                        )
-                        self.pofile[idx] = entry
-                        changed = True
-                    progressbar.advance(2)
-                    await asyncio.sleep(0)
-
-                elif entry.msgid:  # pyright: ignore[reportUnknownMemberType]
-                    if override_existing or not entry.msgstr:  # pyright: ignore[reportUnknownMemberType]
-                        entry.msgstr = correct_translation(
-                            entry.msgid,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
-                            (
-                                await translator.translate(  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType, reportArgumentType]
-                                    entry.msgid,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
-                                )
-                            ),
-                        )
-                        self.logger.debug(
-                            "Translated singular entry",
-                            extra={
-                                "msgid": entry.msgid,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
-                                "msgstr": entry.msgstr,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
-                                "context": "Translator.translate_po",
-                            },
-                        )
-                        self.pofile[idx] = entry
-                        changed = True
-                    progressbar.advance(1)
-                    await asyncio.sleep(0)
-
-                if changed:
-                    write_new_tcomment(
-                        entry,  # pyright: ignore[reportUnknownArgumentType]
-                        " [Translated with {translation_service} on {{timestamp}}]".format(
-                            translation_service=selected_service.value,
-                        ),
-                    )
-                    (POFileEntryTag.FUZZY if mark_as_fuzzy else POFileEntryTag.UNCONFIRMED).apply(
-                        entry,  # pyright: ignore[reportUnknownMemberType,reportUnknownArgumentType]
-                    )
+            # All entries translated in this run share the comment, so it is formatted once
+            tcomment = " [Translated with {translation_service} on {timestamp}]".format(
+                translation_service=selected_service.translation_service_name,
+                timestamp=datetime.now().isoformat(sep=" ", timespec="seconds"),
+            )
+            entries = iter(self.pofile)  # pyright: ignore[reportUnknownArgumentType]
+            workers = [
+                asyncio.ensure_future(
+                    self.translate_entries(translator, entries, progressbar, override_existing, mark_as_fuzzy, tcomment)
+                )
+                for translator in translators
+            ]
+            try:
+                await asyncio.gather(*workers)
+            finally:
+                # Stop the remaining workers if one of them failed or the translation was cancelled
+                for worker in workers:
+                    worker.cancel()
 
             self.logger.info(
                 "Translation completed, saving PO file...",
                 extra={"context": "Translator.translate_po", "path": str(self.pofile_path)},
             )
-            self.pofile.save(str(self.pofile_path))  # pyright: ignore[reportUnknownMemberType]
+            await asyncio.to_thread(self.pofile.save, str(self.pofile_path))  # pyright: ignore[reportUnknownMemberType]
             self._translating = False
             self.dismiss()
             self.logger.info(
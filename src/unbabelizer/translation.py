@@ -1,6 +1,7 @@
 import locale
 import sys
 from collections import Counter
+from functools import cache
 from gettext import translation
 from pathlib import Path
 from typing import Sequence
@@ -36,6 +37,7 @@ def determine_most_common_locale_separator(locales: Sequence[str]) -> str:
     return results[0][0]
 
 
+@cache
 def get_display_name_for_lang_code(lang_code: str) -> str:
     """Resolve a language code to its canonical form using Babel.
 
@@ -56,8 +58,12 @@ def get_display_name_for_lang_code(lang_code: str) -> str:
         return lang_code
 
 
+@cache
 def setup_translation():
-    """Set up the translation system based on the user's locale."""
+    """Set up the translation system based on the user's locale.
+
+    The translation is installed once per process, subsequent calls are no-ops.
+    """
     locale.setlocale(locale.LC_ALL)
     try:
         lang = locale.getdefaultlocale()[0] or "en_US"
@@ -68,7 +74,7 @@ def setup_translation():
 
     tr = translation(
         domain="messages",
-        localedir=(Path(__file__).parent / "locales").resolve(),
+        localedir=Path(__file__).parent / "locales",
         languages=[lang],
         fallback=True,
     )
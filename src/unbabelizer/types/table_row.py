@@ -1,5 +1,6 @@
-from typing import TYPE_CHECKING, NamedTuple, Tuple, overload
+from typing import TYPE_CHECKING, Iterable, NamedTuple, Tuple, overload
 
+from rich.text import Text
 from textual.widgets import DataTable
 
 if TYPE_CHECKING:
@@ -42,8 +43,19 @@ class TableRow(NamedTuple):
         Args:
             table (DataTable[str]): The DataTable to add the row to.
         """
-        table.add_row(
-            *self.actual_row,
-            key=f"{self.row_no:d}",
-            label=f"{self.row_no:d}",
-        )
+        key = f"{self.row_no:d}"
+        # A Text label is used as is, a str label would be parsed as markup
+        table.add_row(*self.actual_row, key=key, label=Text(key, end=""))
+
+    @classmethod
+    def add_all_to_table(cls, table: DataTable[str], rows: Iterable["TableRow"]):
+        """Add TableRows to the given DataTable in one pass.
+
+        DataTable.add_rows cannot set row keys, which are needed to map rows back to their entries.
+
+        Args:
+            table (DataTable[str]): The DataTable to add the rows to.
+            rows (Iterable[TableRow]): The rows to add.
+        """
+        for row in rows:
+            row.add_to_table(table)
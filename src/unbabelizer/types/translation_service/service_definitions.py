@@ -1,3 +1,5 @@
+import asyncio
+
 from deep_translator import (  # pyright: ignore[reportMissingTypeStubs]
     ChatGptTranslator,
     DeeplTranslator,
@@ -27,7 +29,10 @@ class DeeplTranslationService(DeeplTranslator, TranslationServiceBase):
         return True
 
     async def translate(self, text: str) -> str:  # pyright: ignore[reportIncompatibleMethodOverride]
-        return super().translate(text)  # pyright: ignore[reportUnknownMemberType]
+        return await asyncio.to_thread(
+            super().translate,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+            text,
+        )
 
 
 class GoogleTranslationService(GoogleTranslator, TranslationServiceBase):
@@ -45,7 +50,10 @@ class GoogleTranslationService(GoogleTranslator, TranslationServiceBase):
         return True
 
     async def translate(self, text: str) -> str:  # pyright: ignore[reportIncompatibleMethodOverride]
-        return super().translate(text)  # pyright: ignore[reportUnknownMemberType]
+        return await asyncio.to_thread(
+            super().translate,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+            text,
+        )
 
 
 class MyMemoryTranslationService(MyMemoryTranslator, TranslationServiceBase):
@@ -63,7 +71,10 @@ class MyMemoryTranslationService(MyMemoryTranslator, TranslationServiceBase):
         return True
 
     async def translate(self, text: str) -> str:  # pyright: ignore[reportIncompatibleMethodOverride]
-        result = super().translate(text)  # pyright: ignore[reportUnknownMemberType]
+        result = await asyncio.to_thread(
+            super().translate,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+            text,
+        )
         return " ".join(result).replace("  ", " ") if isinstance(result, list) else result
 
 
@@ -92,7 +103,10 @@ class MicrosoftTranslationService(MicrosoftTranslator, TranslationServiceBase):
         return True
 
     async def translate(self, text: str) -> str:  # pyright: ignore[reportIncompatibleMethodOverride]
-        return super().translate(text)  # pyright: ignore[reportUnknownMemberType]
+        return await asyncio.to_thread(
+            super().translate,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+            text,
+        )
 
 
 class YandexTranslationService(YandexTranslator, TranslationServiceBase):
@@ -115,8 +129,12 @@ class YandexTranslationService(YandexTranslator, TranslationServiceBase):
         return True
 
     async def translate(self, text: str) -> str:  # pyright: ignore[reportIncompatibleMethodOverride]
-        return super(YandexTranslator, self).translate(  # pyright: ignore[reportUnknownMemberType]
-            text, proxies={**self._proxies} if self._proxies else None
+        return await asyncio.to_thread(
+            super(
+                YandexTranslator, self
+            ).translate,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+            text,
+            proxies={**self._proxies} if self._proxies else None,
         )
 
 
@@ -135,4 +153,7 @@ class ChatGPTTranslationService(ChatGptTranslator, TranslationServiceBase):
         return True
 
     async def translate(self, text: str) -> str:  # pyright: ignore[reportIncompatibleMethodOverride]
-        return super().translate(text)  # pyright: ignore[reportUnknownMemberType]
+        return await asyncio.to_thread(
+            super().translate,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+            text,
+        )
@@ -3,6 +3,7 @@ import re
 import traceback
 from contextlib import contextmanager
 from datetime import datetime
+from functools import cache, lru_cache
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -90,27 +91,29 @@ def correct_translation(msgid: str, translation: str) -> str:
     return translation.strip()
 
 
+# Translation table of the control characters escaped for display, applied in a single str.translate pass
+_CONTROL_CHARS_ESCAPE_TABLE = str.maketrans(
+    {
+        "\n": "\\n",  # new line
+        "\r": "\\r",  # carriage return
+        "\t": "\\t",  # tab
+        "\b": "\\b",  # backspace
+        "\f": "\\f",  # form feed
+        "\v": "\\v",  # vertical tab
+        "\a": "\\a",  # bell/alert
+        "\\": "\\\\",  # backslash
+        "\0": "\\0",  # null character
+    }
+)
+
+
+@lru_cache(maxsize=4096)
 def escape_control_chars(text: str) -> str:
-    """Escape control characters using character class pattern"""
-
-    def replace_func(match: re.Match[str]) -> str:
-        char = match.group(0)
-        escape_map = {
-            "\n": "\\n",  # new line
-            "\r": "\\r",  # carriage return
-            "\t": "\\t",  # tab
-            "\b": "\\b",  # backspace
-            "\f": "\\f",  # form feed
-            "\v": "\\v",  # vertical tab
-            "\a": "\\a",  # bell/alert
-            "\\": "\\\\",  # backslash
-            "\0": "\\0",  # null character
-        }
-        return escape_map.get(char, f"\\x{ord(char):02x}")
-
-    return re.sub(r"[\n\r\t\b\f\v\a\\\x00]", replace_func, text)
+    """Escape control characters using a precomputed translation table"""
+    return text.translate(_CONTROL_CHARS_ESCAPE_TABLE)
 
 
+@cache
 def get_base_type(ann: Any) -> Any:
     """Recursively extract the base type from complex type annotations.
 
@@ -138,6 +141,46 @@ def get_base_type(ann: Any) -> Any:
     return ann
 
 
+_DOTTED_PATH_PATTERN = re.compile(r"[A-Za-z_]\w*(?:\.[A-Za-z_]\w*|\[\d+\])*")
+_DOTTED_PATH_TOKEN_PATTERN = re.compile(r"([A-Za-z_]\w*)|\[(\d+)\]")
+
+
+def parse_dotted_path(query: str) -> tuple[str | int, ...] | None:
+    """Split a plain JMESPath query like "project.authors[0].name" into keys and indices.
+
+    Args:
+        query (str): The query to split.
+    Returns:
+        tuple[str | int, ...] | None: The keys and list indices to walk, or None if the query uses any other syntax.
+    """
+    if not _DOTTED_PATH_PATTERN.fullmatch(query):
+        return None
+
+    return tuple(int(index) if index else key for key, index in _DOTTED_PATH_TOKEN_PATTERN.findall(query))
+
+
+def search_dotted_path(path: tuple[str | int, ...], data: Any) -> Any:
+    """Walk nested dictionaries and lists along a path returned by parse_dotted_path.
+
+    Args:
+        path (tuple[str | int, ...]): The keys and list indices to walk.
+        data (Any): The data to search.
+    Returns:
+        Any: The value found, or None if the path does not exist (same as jmespath.search).
+    """
+    for step in path:
+        if isinstance(step, int):
+            if not isinstance(data, list) or step >= len(data):  # pyright: ignore[reportUnknownArgumentType]
+                return None
+            data = data[step]  # pyright: ignore[reportUnknownVariableType]
+        else:
+            if not isinstance(data, dict) or step not in data:
+                return None
+            data = data[step]  # pyright: ignore[reportUnknownVariableType]
+
+    return data  # pyright: ignore[reportUnknownVariableType]
+
+
 @contextmanager
 def handle_exception(notifier: NotifyProtocol, logger: Logger):
     """A context manager that notifies the user of any exceptions that occur within its block.
@@ -181,6 +224,7 @@ def run_babel_cmd(args: Sequence[str]):
         ) from e
 
 
+@lru_cache(maxsize=4096)
 def unescape_control_chars(text: str) -> str:
     """Unescape control chars including hex notation"""
 